@@ -22,8 +22,13 @@ Motion Builder:
 import re
 import sys
 
-from ..utils import CustomEncoder
-from ..utils.application import standardiseVersions
+try:
+    from importlib.util import find_spec
+except ImportError:  # Python 2
+    find_spec = None
+
+from ..utils import CustomEncoder, cachedproperty, lru_cache
+from ..utils.application import standardiseVersions, _tokeniseVersion
 
 
 class AbstractApplication(str):
@@ -33,18 +38,26 @@ class AbstractApplication(str):
 
     IMPORTS = []  # List of program imports to test for
 
-    PATHS = []  # Valid paths of the executable
+    PATHS = []  # Valid paths of the executable (regex strings or patterns)
 
     VERSION = None  # Subclass of `AbstractVersion`
 
     def __new__(cls):
+        # Only a single instance is needed per application
+        new = cls.__dict__.get('_instance')
+        if new is not None:
+            return new
+
         new = str.__new__(cls, cls.NAME)
         new.name = cls.NAME
+
+        # Cache the name variations used for comparisons
+        new._nameLower = cls.NAME.lower()
+        new._nameParts = tuple(new._nameLower.split(' ')) if ' ' in new._nameLower else ()
+        new._nameJoined = new._nameLower.replace(' ', '')
+
         new.loaded = cls.isLoaded()
-        if cls.VERSION is None or not new.loaded:
-            new.version = None
-        else:
-            new.version = cls.VERSION()
+        cls._instance = new
         return new
 
     def __bool__(self):
@@ -54,27 +67,26 @@ class AbstractApplication(str):
 
     def __contains__(self, other):
         try:
-            return other.lower() in self.name.lower()
+            return other.lower() in self._nameLower
         except AttributeError:
             return False
 
     def __eq__(self, other):
         """Case insensitive string comparison."""
-        name = self.name.lower()
         try:
             other = other.lower()
         except AttributeError:
             return False
 
-        if name == other:
+        if self._nameLower == other:
             return True
 
-        if ' ' in name:
+        if self._nameParts:
             # Check if name contains a part ('3ds Max' == 'Max')
-            if ' ' not in other and any(part in other for part in name.split(' ')):
+            if ' ' not in other and any(part in other for part in self._nameParts):
                 return True
             # Check if mismatched spaces ('3ds Max' == '3dsmax')
-            if name.replace(' ', '') == other.replace(' ', ''):
+            if self._nameJoined == other.replace(' ', ''):
                 return True
 
         return False
@@ -87,6 +99,7 @@ class AbstractApplication(str):
         return hash(self.name)
 
     @classmethod
+    @lru_cache(maxsize=None)
     def isLoaded(cls):
         """Determine if the application is currently loaded.
 
@@ -95,22 +108,58 @@ class AbstractApplication(str):
         (an example of this is Maya being able to import `hou`).
         This can be paired with checking for known executable paths.
 
-        Note that the imports are done with both `pkgutil.find_loader`
-        and `importlib.util.find_spec`, so a simple `__import__` is
-        much cleaner to use in this case.
+        Where available, `importlib.util.find_spec` is used so that the
+        module can be located without executing it. Python 2 has no
+        equivalent, so it falls back to a simple `__import__`.
+
+        The result is cached per class, and can be reset with
+        `AbstractApplication.isLoaded.cache_clear()`.
         """
-        if any((re.search(pattern, sys.executable) for pattern in cls.PATHS)):
+        if cls._matchesPath(sys.executable):
             for imp in cls.IMPORTS:
                 if imp in sys.modules:
                     return True
 
                 try:
-                    if __import__(imp):
+                    if find_spec is None:
+                        if __import__(imp):
+                            return True
+                    elif find_spec(imp) is not None:
                         return True
-                except ImportError:
+                except (ImportError, ValueError):
                     pass
         return False
 
+    @classmethod
+    def _matchesPath(cls, path):
+        """Determine if a path matches any of the executable `PATHS`."""
+        regex = cls._pathsRegex()
+        return regex is not None and regex.search(path) is not None
+
+    @classmethod
+    def _pathsRegex(cls):
+        """Get all the `PATHS` combined into a single regex.
+        This is compiled on first use and stored on the class.
+        Any patterns that are already compiled will be merged in.
+        """
+        if '_PATHS_REGEX' not in cls.__dict__:
+            if cls.PATHS:
+                patterns = (getattr(path, 'pattern', path) for path in cls.PATHS)
+                cls._PATHS_REGEX = re.compile('|'.join('(?:{})'.format(pattern) for pattern in patterns))
+            else:
+                cls._PATHS_REGEX = None
+        return cls._PATHS_REGEX
+
+    @cachedproperty
+    def version(self):
+        """Get the application version.
+        This is only read on first access, as it may need to query the
+        application.
+        """
+        if self.VERSION is None or not self.loaded:
+            return None
+        return self.VERSION()
+
     @property
     def gui(self):
         """If the application is in GUI mode."""
@@ -122,7 +171,22 @@ class AbstractApplication(str):
         return not self.gui
 
 
-class AbstractVersion(object):
+class _VersionMeta(type):
+    """Reuse the same version instance when created without arguments.
+    An application only has a single version per session, so there is
+    no need to query it again each time.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        if args or kwargs:
+            return super(_VersionMeta, cls).__call__(*args, **kwargs)
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = cls._instance = super(_VersionMeta, cls).__call__()
+        return instance
+
+
+class AbstractVersion(_VersionMeta('_VersionBase', (object,), {})):
     """Application version data for comparisons."""
 
     def __init__(self, version=None, major=None, minor=None, patch=None):
@@ -134,39 +198,20 @@ class AbstractVersion(object):
             for num in parts:
                 if num is None:
                     break
-                validParts.append(num)
+                validParts.append(str(num))
             version = '.'.join(validParts)
-        self.version = str(version)
-
-        # Split to major/minor/patch
-        if major is not None:
-            major = str(major)
-        if minor is not None:
-            minor = str(minor)
-        if patch is not None:
-            patch = str(patch)
-
-        self.major = major
-        self.minor = minor
-        self.patch = patch
-
-        if None in parts:
-            split = version.replace('v', '.').split('.')
-            if self.major is None:
-                try:
-                    self.major = split[0]
-                except IndexError:
-                    self.major = '0'
-            if self.minor is None:
-                try:
-                    self.minor = split[1]
-                except IndexError:
-                    self.minor = '0'
-            if self.patch is None:
-                try:
-                    self.patch = split[2]
-                except IndexError:
-                    self.patch = '0'
+        self.version = version if isinstance(version, str) else str(version)
+
+        # Split to major/minor/patch, filling in any missing parts
+        split = self.version.replace('v', '.').split('.') if self.version else []
+        numParts = len(split)
+        self.major = str(major) if major is not None else (split[0] if numParts > 0 else '0')
+        self.minor = str(minor) if minor is not None else (split[1] if numParts > 1 else '0')
+        self.patch = str(patch) if patch is not None else (split[2] if numParts > 2 else '0')
+        self._parts = (self.major, self.minor, self.patch)
+
+        # Versions don't change, so tokenise once for all comparisons
+        self._tokens = _tokeniseVersion(self.version)
 
     def __repr__(self):
         return repr(self.version)
@@ -189,41 +234,89 @@ class AbstractVersion(object):
 
     def __eq__(self, other):
         """Determine if two versions are equal."""
-        a, b = standardiseVersions(self.version, other)
+        a, b = self._standardise(other)
         return a == b
 
     def __ne__(self, other):
         """Determine if two versions are not equal."""
-        a, b = standardiseVersions(self.version, other)
+        a, b = self._standardise(other)
         return a != b
 
+    # Versions of different lengths can be equal (eg. `1.2 == 1.2.3`),
+    # so there is no hash that would be consistent with `__eq__`
+    __hash__ = None
+
     def __gt__(self, other):
         """Determine if the current version is higher."""
-        a, b = standardiseVersions(self.version, other)
+        a, b = self._standardise(other)
         return a > b
 
     def __ge__(self, other):
         """Determine if the current version is higher or equal."""
-        a, b = standardiseVersions(self.version, other)
+        a, b = self._standardise(other)
         return a >= b
 
     def __lt__(self, other):
         """Determine if the current version is lower."""
-        a, b = standardiseVersions(self.version, other)
+        a, b = self._standardise(other)
         return a < b
 
     def __le__(self, other):
         """Determine if the current version is lower or equal."""
-        a, b = standardiseVersions(self.version, other)
+        a, b = self._standardise(other)
         return a <= b
 
+    def _standardise(self, other):
+        """Get the standardised values of both versions for comparison.
+        If comparing against another version or a string, the stored
+        tokens are used and the generic `standardiseVersions` can be
+        skipped.
+        """
+        if isinstance(other, AbstractVersion):
+            b = other._tokens
+            other = other.version
+        elif isinstance(other, str):
+            b = _tokeniseVersion(other)
+        else:
+            return standardiseVersions(self.version, other)
+
+        a = self._tokens
+        if a and b:
+            tokenLen = min(len(a), len(b))
+            return a[:tokenLen], b[:tokenLen]
+        return standardiseVersions(self.version, other)
+
     def __getitem__(self, item):
         """Get the major/minor/patch number from an index."""
-        return (self.major, self.minor, self.patch)[item]
+        return self._parts[item]
+
+    def __iter__(self):
+        """Iterate over the major/minor/patch numbers."""
+        return iter(self._parts)
+
+    def __len__(self):
+        return len(self._parts)
 
     def split(self, sep='.'):
         """Get all the version parts."""
         return self.version.split(sep)
 
 
+def lazyApplication(cls):
+    """Provide a module level `Application` that is created on first access.
+    This should be set as the module's `__getattr__`.
+
+    Python versions before 3.7 don't support `__getattr__` on modules,
+    so the application is set on the module straight away instead.
+    """
+    if sys.version_info < (3, 7):
+        sys.modules[cls.__module__].Application = cls()
+
+    def __getattr__(name):
+        if name == 'Application':
+            return cls()
+        raise AttributeError('module {!r} has no attribute {!r}'.format(cls.__module__, name))
+    return __getattr__
+
+
 CustomEncoder.register(AbstractApplication, str)
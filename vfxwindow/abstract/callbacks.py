@@ -106,11 +106,12 @@ class CallbackProxy(object):
 class CallbackAliases(object):
     """Alias a callback."""
 
-    __slots__ = ['_data', '_function']
+    __slots__ = ['_data', '_function', '_cache']
 
     def __init__(self):
         self._data = {}
         self._function = None
+        self._cache = {}
 
     def __repr__(self):
         return repr(self.items())
@@ -159,6 +160,12 @@ class CallbackAliases(object):
         >>> aliases['x']
         (register, unregister)
         """
+        # Resolved aliases are cached until the aliases are modified
+        try:
+            return self._cache[alias]
+        except KeyError:
+            pass
+
         # Get alias for every level up to current
         current = self
         func = current._function
@@ -184,6 +191,7 @@ class CallbackAliases(object):
         if func is None:
             raise KeyError(alias)
 
+        self._cache[alias] = func
         return func
 
     def __setitem__(self, alias, data):
@@ -203,6 +211,8 @@ class CallbackAliases(object):
         Raises:
             AliasAlreadyExistsError: If the alias is already registered.
         """
+        self._cache.clear()
+
         # Walk to the correct point
         current = self
         for part in alias.split('.'):
@@ -221,10 +231,23 @@ class CallbackAliases(object):
                 data = CallbackFunction(*data)
         current._function = CallbackFunction(*data)
 
+    def update(self, aliases):
+        """Create multiple aliases.
+
+        Parameters:
+            aliases (iterable): Pairs of `(alias, data)`.
+                See `__setitem__` for the format of `data`.
+        """
+        setAlias = self.__setitem__
+        for alias, data in aliases:
+            setAlias(alias, data)
+
     def __delitem__(self, alias):
         """Delete an alias.
         If a child alias exists, it will not be deleted.
         """
+        self._cache.clear()
+
         # Create a stack of each child until the requested data
         stack = []
         data = self._data
@@ -250,6 +273,11 @@ class CallbackAliases(object):
 
     def __contains__(self, alias):
         """Check if an alias exists."""
+        # Top level aliases don't need splitting
+        if '.' not in alias:
+            current = self._data.get(alias)
+            return current is not None and current._function is not None
+
         current = self
         for part in alias.split('.'):
             if part not in current._data:
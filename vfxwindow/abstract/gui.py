@@ -55,6 +55,8 @@ class AbstractWindow(QtWidgets.QMainWindow):
 
     _WINDOW_INSTANCES = {}
 
+    _TEMP_FOLDER_CREATED = False
+
     def __init__(self, parent=None, **kwargs):
         super(AbstractWindow, self).__init__(parent, **kwargs)
         self.callbacks = self._createCallbackHandler()
@@ -69,12 +71,17 @@ class AbstractWindow(QtWidgets.QMainWindow):
 
         # Read settings
         self._windowDataPath = getWindowSettingsPath(self.WindowID)
-        tempFolder = os.path.dirname(self._windowDataPath)
-        if not os.path.exists(tempFolder):
-            os.makedirs(tempFolder)
+        if not AbstractWindow._TEMP_FOLDER_CREATED:
+            folder = os.path.dirname(self._windowDataPath)
+            try:
+                os.makedirs(folder)
+            except OSError:
+                if not os.path.isdir(folder):
+                    raise
+            AbstractWindow._TEMP_FOLDER_CREATED = True
         self.windowSettings = getWindowSettings(self.WindowID, path=self._windowDataPath)
 
-        self._signals = defaultdict(list)
+        self._signals = {}
         self._windowClosed = self._windowLoaded = False
         self.__dockable = getattr(self, 'WindowDockable', False)
         self.__wasDocked = None
@@ -205,7 +212,7 @@ class AbstractWindow(QtWidgets.QMainWindow):
 
     def signalExists(self, group):
         """How many signals exist for the given group."""
-        return len(self.signal(group) or [])
+        return len(self._signals.get(group, ()))
 
     def signalConnect(self, signal, func, type=QtCore.Qt.AutoConnection, group=None):
         """Add a new signal for the current group.
@@ -216,7 +223,7 @@ class AbstractWindow(QtWidgets.QMainWindow):
         if self.signalPaused(group):
             self.__signalCache[group].append((signal, func, type))
         else:
-            self._signals[group].append((signal, func, type))
+            self._signals[group] = self._signals.get(group, ()) + ((signal, func, type),)
             signal.connect(func)
         return func
 
@@ -610,10 +617,10 @@ class AbstractWindow(QtWidgets.QMainWindow):
                 return
             windowID = self.WindowID
 
-        if windowID in cls._WINDOW_INSTANCES:
-            if delete and self is cls:
-                return cls.clearWindowInstance(windowID)
-            return cls._WINDOW_INSTANCES[windowID]
+        inst = cls._WINDOW_INSTANCES.get(windowID)
+        if inst is not None and delete and self is cls:
+            return cls.clearWindowInstance(windowID)
+        return inst
 
     @classmethod
     def clearWindowInstance(cls, windowID):
@@ -682,73 +689,70 @@ class AbstractWindow(QtWidgets.QMainWindow):
         """
         return True
 
+    def _geometryTarget(self):
+        """Get the widget to forward any geometry calls to.
+        If the window itself should be used, None is returned.
+        """
+        if self.isInstance():
+            return None
+        if self.dockable():
+            return self._parentOverride()
+        if self.isDialog():
+            return self.parent()
+        return None
+
     def move(self, x, y=None):
         if self.isInstance():
             return
         if isinstance(x, QtCore.QPoint):
             y = x.y()
             x = x.x()
-        if self.dockable():
-            return self._parentOverride().move(x, y)
-        elif self.isDialog():
-            return self.parent().move(x, y)
-        return super(AbstractWindow, self).move(x, y)
+        target = self._geometryTarget()
+        if target is None:
+            return super(AbstractWindow, self).move(x, y)
+        return target.move(x, y)
 
     def geometry(self):
-        if not self.isInstance():
-            if self.dockable():
-                return self._parentOverride().geometry()
-            elif self.isDialog():
-                return self.parent().geometry()
-        return super(AbstractWindow, self).geometry()
+        target = self._geometryTarget()
+        if target is None:
+            return super(AbstractWindow, self).geometry()
+        return target.geometry()
 
     def frameGeometry(self):
-        if not self.isInstance():
-            if self.dockable():
-                return self._parentOverride().frameGeometry()
-            elif self.isDialog():
-                return self.parent().frameGeometry()
-        return super(AbstractWindow, self).frameGeometry()
+        target = self._geometryTarget()
+        if target is None:
+            return super(AbstractWindow, self).frameGeometry()
+        return target.frameGeometry()
 
     def rect(self):
-        if not self.isInstance():
-            if self.dockable():
-                return self._parentOverride().rect()
-            elif self.isDialog():
-                return self.parent().rect()
-        return super(AbstractWindow, self).rect()
+        target = self._geometryTarget()
+        if target is None:
+            return super(AbstractWindow, self).rect()
+        return target.rect()
 
     def width(self):
-        if not self.isInstance():
-            if self.dockable():
-                return self._parentOverride().width()
-            elif self.isDialog():
-                return self.parent().width()
-        return super(AbstractWindow, self).width()
+        target = self._geometryTarget()
+        if target is None:
+            return super(AbstractWindow, self).width()
+        return target.width()
 
     def height(self):
-        if not self.isInstance():
-            if self.dockable():
-                return self._parentOverride().height()
-            elif self.isDialog():
-                return self.parent().height()
-        return super(AbstractWindow, self).height()
+        target = self._geometryTarget()
+        if target is None:
+            return super(AbstractWindow, self).height()
+        return target.height()
 
     def x(self):
-        if not self.isInstance():
-            if self.dockable():
-                return self._parentOverride().x()
-            elif self.isDialog():
-                return self.parent().x()
-        return super(AbstractWindow, self).x()
+        target = self._geometryTarget()
+        if target is None:
+            return super(AbstractWindow, self).x()
+        return target.x()
 
     def y(self):
-        if not self.isInstance():
-            if self.dockable():
-                return self._parentOverride().y()
-            elif self.isDialog():
-                return self.parent().y()
-        return super(AbstractWindow, self).y()
+        target = self._geometryTarget()
+        if target is None:
+            return super(AbstractWindow, self).y()
+        return target.y()
 
     def resize(self, width, height=None):
         if self.isInstance():
@@ -757,11 +761,10 @@ class AbstractWindow(QtWidgets.QMainWindow):
         if isinstance(width, QtCore.QSize):
             height = width.height()
             width = width.width()
-        if self.dockable():
-            return self._parentOverride().resize(width, height)
-        elif self.isDialog():
-            return self.parent().resize(width, height)
-        return super(AbstractWindow, self).resize(width, height)
+        target = self._geometryTarget()
+        if target is None:
+            return super(AbstractWindow, self).resize(width, height)
+        return target.resize(width, height)
 
     def setMinimumWidth(self, *args, **kwargs):
         if self.isDialog():
@@ -819,10 +822,11 @@ class AbstractWindow(QtWidgets.QMainWindow):
                 base = self
 
             if parentGeometry is None:
-                try:
-                    parentGeometry = base.parent().frameGeometry()
+                parent = base.parent()
+                if parent is not None:
+                    parentGeometry = parent.frameGeometry()
 
-                except AttributeError:
+                else:
                     # PySide2 / PySide6
                     try:
                         parentGeometry = QtWidgets.QApplication.primaryScreen().geometry()
@@ -1,4 +1,9 @@
-"""Access all the application classes"""
+"""Access all the application classes.
+
+Each application is only created the first time it is accessed, and is
+then cached. If an application is loaded after this point (such as a
+plugin importing `bpy` late), call `invalidate()` to detect it again.
+"""
 
 __all__ = [
     'Blender',
@@ -16,16 +21,81 @@ __all__ = [
     'Unreal'
 ]
 
-from .blender.application import Application as Blender
-from .cryengine.application import Application as CryEngine
-from .fusion.application import Application as Fusion
-from .houdini.application import Application as Houdini
-from .katana.application import Application as Katana
-from .max.application import Application as Max
-from .maya.application import Application as Maya
-from .natron.application import Application as Natron
-from .nuke.application import Application as Nuke
-from .renderdoc.application import Application as RenderDoc
-from .substance_designer.application import Application as SubstanceDesigner
-from .substance_painter.application import Application as SubstancePainter
-from .unreal.application import Application as Unreal
+import sys
+
+from .abstract.application import AbstractApplication
+from .blender.application import BlenderApplication
+from .cryengine.application import CryEngineApplication
+from .fusion.application import FusionApplication
+from .houdini.application import HoudiniApplication
+from .katana.application import KatanaApplication
+from .max.application import MaxApplication
+from .maya.application import MayaApplication
+from .natron.application import NatronApplication
+from .nuke.application import NukeApplication
+from .renderdoc.application import RenderDocApplication
+from .substance_designer.application import SubstanceDesignerApplication
+from .substance_painter.application import SubstancePainterApplication
+from .unreal.application import UnrealApplication
+
+
+_SINGLETON_CLASSES = {
+    'Blender': BlenderApplication,
+    'CryEngine': CryEngineApplication,
+    'Fusion': FusionApplication,
+    'Houdini': HoudiniApplication,
+    'Katana': KatanaApplication,
+    'Max': MaxApplication,
+    'Maya': MayaApplication,
+    'Natron': NatronApplication,
+    'Nuke': NukeApplication,
+    'RenderDoc': RenderDocApplication,
+    'SubstanceDesigner': SubstanceDesignerApplication,
+    'SubstancePainter': SubstancePainterApplication,
+    'Unreal': UnrealApplication,
+}
+
+
+def _get(name):
+    """Get the instance of an application.
+    Each application class only ever creates a single instance.
+    """
+    return _SINGLETON_CLASSES[name]()
+
+
+def _bindApplications():
+    """Set every application as a module attribute.
+    This is only required for Python versions without PEP 562.
+    """
+    for name in _SINGLETON_CLASSES:
+        globals()[name] = _get(name)
+
+
+def invalidate():
+    """Detect every application again.
+    Any existing instances are updated in place, so references held
+    elsewhere (such as by the window classes) stay valid.
+    """
+    AbstractApplication.isLoaded.cache_clear()
+    for cls in _SINGLETON_CLASSES.values():
+        if cls.VERSION is not None:
+            cls.VERSION._instance = None
+        instance = cls.__dict__.get('_instance')
+        if instance is not None:
+            instance.loaded = cls.isLoaded()
+            instance.__dict__.pop('version', None)
+
+
+def __getattr__(name):
+    """Create the application on first access."""
+    if name in _SINGLETON_CLASSES:
+        return _get(name)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SINGLETON_CLASSES))
+
+
+if sys.version_info < (3, 7):
+    _bindApplications()
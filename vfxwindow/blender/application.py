@@ -4,16 +4,20 @@ try:
     import bpy
 except ImportError:
     bpy = None
+    _VERSION_STRING = _VERSION = None
+else:
+    # The version can't change, so only read it once
+    _VERSION_STRING = bpy.app.version_string  # '3.6.0'
+    _VERSION = tuple(bpy.app.version)  # (3, 6, 0)
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
 
 
 class BlenderVersion(AbstractVersion):
     """Blender version data for comparisons."""
 
     def __init__(self):
-        super(BlenderVersion, self).__init__(bpy.app.version_string,  # '3.6.0'
-                                             *bpy.app.version)  # (3, 6, 0)
+        super(BlenderVersion, self).__init__(_VERSION_STRING, *_VERSION)
 
 
 class BlenderApplication(AbstractApplication):
@@ -37,4 +41,4 @@ class BlenderApplication(AbstractApplication):
         return not bpy.app.background
 
 
-Application = BlenderApplication()
+__getattr__ = lazyApplication(BlenderApplication)
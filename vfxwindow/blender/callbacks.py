@@ -1,40 +1,163 @@
 from __future__ import absolute_import
 
-from functools import partial
+import inspect
 
 import bpy
 
 from ..abstract.callbacks import AbstractCallbacks, CallbackProxy
 
 
+# Blender handlers for each alias
+_HANDLERS = (
+    ('file.load.before', 'load_pre'),
+    ('file.load.after', 'load_post'),
+    ('file.load.fail', 'load_post_fail'),
+    ('file.save.before', 'save_pre'),
+    ('file.save.after', 'save_post'),
+    ('file.save.fail', 'save_post_fail'),
+    ('frame.changed.before', 'frame_change_pre'),
+    ('frame.changed.after', 'frame_change_post'),
+    ('playback.before', 'animation_playback_pre'),
+    ('playback.after', 'animation_playback_post'),
+    ('render.before', 'render_init'),
+    ('render.after', ('render_complete', 'render_cancel')),
+    ('render.complete', 'render_complete'),
+    ('render.cancel', 'render_cancel'),
+    ('render.stats', 'render_stats'),
+    ('render.frame.before', 'render_pre'),
+    ('render.frame.after', 'render_post'),
+    ('render.frame.write', 'render_write'),
+    ('undo.before', 'undo_pre'),
+    ('undo.after', 'undo_post'),
+    ('redo.before', 'redo_pre'),
+    ('redo.after', 'redo_post'),
+)
+
+
+def _throttle(func, interval):
+    """Wrap a handler so it runs at most once per interval.
+    Any calls made while waiting are merged into one.
+
+    Blender only guarantees the handler arguments during the callback,
+    so the function is called without any, and should read what it
+    needs from `bpy.context`.
+
+    Raises:
+        TypeError: If the function can't be called without arguments.
+    """
+    _checkNoArguments(func)
+
+    def flush():
+        func()
+
+    def throttled(*args):
+        # Checking the timer itself means it can't get stuck if
+        # Blender drops it, such as when loading a new file
+        if not bpy.app.timers.is_registered(flush):
+            bpy.app.timers.register(flush, first_interval=interval, persistent=True)
+
+    def cancel():
+        if bpy.app.timers.is_registered(flush):
+            bpy.app.timers.unregister(flush)
+
+    if hasattr(func, '_bpy_persistent'):
+        throttled._bpy_persistent = None
+    throttled._throttledFunc = func
+    throttled._cancelThrottle = cancel
+    return throttled
+
+
+def _checkNoArguments(func):
+    """Raise an error if a function requires any arguments."""
+    try:
+        signature = inspect.signature(func)
+    except AttributeError:  # Python 2
+        return
+    except (TypeError, ValueError):  # No signature available
+        return
+    try:
+        signature.bind()
+    except TypeError:
+        raise TypeError('throttled callbacks are called without arguments, '
+                        'but {!r} requires {}'.format(func, signature))
+
+
+def _cancelThrottle(func):
+    """Stop a throttled handler from running once it's removed."""
+    cancel = getattr(func, '_cancelThrottle', None)
+    if cancel is not None:
+        cancel()
+
+
+def _containsIdentical(handler, func):
+    """Check if a function is in a handler list.
+    Other addons may add partials or bound methods, which can be slow
+    to compare, so only the identity is checked.
+    A throttled handler also matches the function it wraps.
+    """
+    for f in handler:
+        if f is func or getattr(f, '_throttledFunc', None) is func:
+            return True
+    return False
+
+
 class BlenderCallbackProxy(CallbackProxy):
 
     def forceUnregister(self):
         """Unregister the callback without any extra checks."""
         self._unregister(self.func)
+        _cancelThrottle(self.func)
 
     @property
     def registered(self):
-        """Determine if the callback is registered."""
-        return self.func in self._register.__self__
+        """Determine if the callback is registered.
+        Blender may remove handlers when loading a new file, so the
+        handler list is checked, but only if it was registered here.
+        """
+        if not self._registered:
+            return False
+        handler = self._register.__self__
+        if isinstance(handler, _MultiHandler):
+            return self.func in handler
+        return _containsIdentical(handler, self.func)
 
 
 class _MultiHandler(object):
     """Wrap multiple handlers into one while keeping the same behaviour."""
 
+    __slots__ = ['handlers', '_appends', '_removes', '_members']
+
     def __init__(self, *handlers):
-        self.handlers = [getattr(bpy.app.handlers, n) for n in handlers]
+        """Setup the handlers.
+        Each handler may be given as a name or as the list itself.
+        """
+        self.handlers = tuple(
+            getattr(bpy.app.handlers, handler) if isinstance(handler, str) else handler
+            for handler in handlers
+        )
+        self._appends = tuple(handler.append for handler in self.handlers)
+        self._removes = tuple(handler.remove for handler in self.handlers)
+        self._members = set()
 
     def __contains__(self, func):
-        return any(func in handler for handler in self.handlers)
+        # Anything not added through here can be skipped straight away
+        # If it was added, Blender may have since removed it, so check
+        if id(func) not in self._members:
+            return False
+        for handler in self.handlers:
+            if _containsIdentical(handler, func):
+                return True
+        return False
 
     def append(self, func):
-        for handler in self.handlers:
-            handler.append(func)
+        self._members.add(id(func))
+        for append in self._appends:
+            append(func)
 
     def remove(self, func):
-        for handler in self.handlers:
-            handler.remove(func)
+        self._members.discard(id(func))
+        for remove in self._removes:
+            remove(func)
 
 
 class BlenderCallbacks(AbstractCallbacks):
@@ -196,44 +319,55 @@ class BlenderCallbacks(AbstractCallbacks):
 
     CallbackProxy = BlenderCallbackProxy
 
+    def add(self, alias, func, *args, **kwargs):
+        """Add a pre-defined callback.
+
+        Parameters:
+            throttle (float): Limit how often the function can run, in seconds.
+                This is intended for callbacks that may trigger many times
+                a second, such as "frame.changed" during playback.
+                The function will be called without any arguments.
+        """
+        throttle = kwargs.pop('throttle', None)
+        if throttle:
+            func = _throttle(func, throttle)
+        return super(BlenderCallbacks, self).add(alias, func, *args, **kwargs)
+
     def _setupAliases(self):
         """Setup Blender callback aliases."""
-        handlers = {
-            'file.load.before': 'load_pre',
-            'file.load.after': 'load_post',
-            'file.load.fail': 'load_post_fail',
-            'file.save.before': 'save_pre',
-            'file.save.after': 'save_post',
-            'file.save.fail': 'save_post_fail',
-            'frame.changed.before': 'frame_change_pre',
-            'frame.changed.after': 'frame_change_post',
-            'playback.before': 'animation_playback_pre',
-            'playback.after': 'animation_playback_post',
-            'render.before': 'render_init',
-            'render.after': _MultiHandler('render_complete', 'render_cancel'),
-            'render.complete': 'render_complete',
-            'render.cancel': 'render_cancel',
-            'render.stats': 'render_stats',
-            'render.frame.before': 'render_pre',
-            'render.frame.after': 'render_post',
-            'render.frame.write': 'render_write',
-            'undo.before': 'undo_pre',
-            'undo.after': 'undo_post',
-            'redo.before': 'redo_pre',
-            'redo.after': 'redo_post',
-        }
-        for alias, name in handlers.items():
-            try:
-                if isinstance(name, _MultiHandler):
-                    handler = name
-                else:
-                    handler = getattr(bpy.app.handlers, name)
-                register = handler.append
-                unregister = handler.remove
-            except AttributeError:
+        aliases = []
+        for alias, shortcut, register, unregister in _ALIAS_TABLE:
+            if shortcut is not None:
+                aliases.append((shortcut, (register, unregister)))
+            aliases.append((alias, (register, unregister)))
+        self.aliases.update(aliases)
+
+
+def _buildAliasTable():
+    """Get the register and unregister functions for each alias.
+    The available handlers can't change during a session, so this is
+    only run once on import. Any handlers missing from the current
+    version of Blender will be skipped.
+
+    Any ".after" alias also gets a shortcut without the suffix.
+
+    Returns:
+        Tuple of `(alias, shortcut, register, unregister)`.
+    """
+    handlers = bpy.app.handlers
+    table = []
+    for alias, name in _HANDLERS:
+        if isinstance(name, tuple):
+            if not all(hasattr(handlers, n) for n in name):
                 continue
+            handler = _MultiHandler(*(getattr(handlers, n) for n in name))
+        elif hasattr(handlers, name):
+            handler = getattr(handlers, name)
+        else:
+            continue
+        shortcut = alias.rsplit('.', 1)[0] if alias.endswith('.after') else None
+        table.append((alias, shortcut, handler.append, handler.remove))
+    return tuple(table)
+
 
-            if alias.endswith('.after'):
-                self.aliases[alias.rsplit('.', 1)[0]] = self.aliases[alias] = (register, unregister)
-            else:
-                self.aliases[alias] = (register, unregister)
+_ALIAS_TABLE = _buildAliasTable()
@@ -5,11 +5,25 @@ import sys
 import Qt
 
 
+class _QtWebEngineCore(object):
+    """Replacement for the QtWebEngineCore module."""
+
+    QWebEnginePage = None
+    QWebEngineProfile = None
+
+
+_WEB_ENGINE_BYPASSED = False
+
+
 def bypassWebEngine():
     """Blender 4.2 introducted a crash on import on Windows machines.
     Bypassing the QWebEngine components solves it.
     https://community.shotgridsoftware.com/t/shotgrid-with-tk-blender/17217/11
     """
+    global _WEB_ENGINE_BYPASSED
+    if _WEB_ENGINE_BYPASSED:
+        return
+
     # PySide6 support added in Qt 1.4.1
     isPySide6 = getattr(Qt, 'IsPySide6', False)
     if not isPySide6 or sys.platform != 'win32':
@@ -18,8 +32,6 @@ def bypassWebEngine():
     # Override QtWebEngine for both Qt and PySide6
     # PySide6 is included here just to fix it for other scripts
     import PySide6
-    class QtWebEngineCore:
-        QWebEnginePage = None
-        QWebEngineProfile = None
-    Qt.QtWebEngineCore = PySide6.QtWebEngineCore = QtWebEngineCore
+    Qt.QtWebEngineCore = PySide6.QtWebEngineCore = _QtWebEngineCore
     Qt.QtWebEngineWidgets = PySide6.QtWebEngineWidgets = None
+    _WEB_ENGINE_BYPASSED = True
@@ -8,29 +8,58 @@ from functools import partial
 import bpy
 
 from .application import Application
-from .callbacks import BlenderCallbacks
+from .callbacks import BlenderCallbacks, _cancelThrottle, _containsIdentical, _throttle
 from ..utils import setCoordinatesToScreen, hybridmethod, deprecate
 from ..standalone.gui import StandaloneWindow
 
 
+_HANDLER_LISTS = {}
+
+
+def _getHandlerList(name):
+    """Get a Blender handler list.
+    The lists exist for the whole session, so they are cached.
+    """
+    try:
+        return _HANDLER_LISTS[name]
+    except KeyError:
+        handlerList = _HANDLER_LISTS[name] = getattr(bpy.app.handlers, name)
+        return handlerList
+
+
+def _runWithoutReturn(func, args, kwargs):
+    """Execute without a return value.
+
+    The timer uses return values to determine when to next run
+    the function, so skipping it ensures it's only run once.
+    """
+    func(*args, **kwargs)
+
+
+def _unindexCallback(index, func, group, handler):
+    """Remove a registered callback from the reverse lookup."""
+    key = id(getattr(func, '_throttledFunc', func))
+    entries = index.get(key)
+    if not entries:
+        return
+    for i, (callbackGroup, callbackHandler, registered) in enumerate(entries):
+        if registered is func and callbackGroup == group and callbackHandler == handler:
+            del entries[i]
+            break
+    if not entries:
+        del index[key]
+
+
 class BlenderWindow(StandaloneWindow):
     """Window to use for Blender."""
 
     def saveWindowPosition(self):
         """Save the window location."""
-        if self.application in self.windowSettings:
-            settings = self.windowSettings[self.application]
-        else:
-            settings = self.windowSettings[self.application] = {}
-
-        key = self._getSettingsKey()
-        if key not in settings:
-            settings[key] = {}
-
-        settings[key]['width'] = self.width()
-        settings[key]['height'] = self.height()
-        settings[key]['x'] = self.x()
-        settings[key]['y'] = self.y()
+        settings = self.windowSettings.setdefault(self.application, {}).setdefault(self._getSettingsKey(), {})
+        settings['width'] = self.width()
+        settings['height'] = self.height()
+        settings['x'] = self.x()
+        settings['y'] = self.y()
 
         super(BlenderWindow, self).saveWindowPosition()
 
@@ -45,14 +74,7 @@ class BlenderWindow(StandaloneWindow):
 
     def deferred(self, func, *args, **kwargs):
         """Defer the execution of a function."""
-        def noReturn():
-            """Execute without a return value.
-
-            The timer uses return values to determine when to next run
-            the function, so skipping it ensures it's only run once.
-            """
-            func(*args, **kwargs)
-        bpy.app.timers.register(noReturn, first_interval=0)
+        bpy.app.timers.register(partial(_runWithoutReturn, func, args, kwargs), first_interval=0)
 
     def loadWindowPosition(self):
         """Set the position of the window when loaded."""
@@ -117,13 +139,28 @@ class BlenderWindow(StandaloneWindow):
             groups = [group]
 
         numEvents = 0
+        index = windowInstance.get('callback_index', {})
         for group in groups:
-            for callback_attr, callbacks in windowInstance['callback'][group].items():
-                callback_list = getattr(bpy.app.handlers, callback_attr)
+            for callback_attr, callbacks in windowInstance['callback'].pop(group).items():
                 for func in callbacks:
-                    callback_list.remove(func)
-                    numEvents += 1
-            del windowInstance['callback'][group]
+                    _unindexCallback(index, func, group, callback_attr)
+                    _cancelThrottle(func)
+                callback_list = _getHandlerList(callback_attr)
+
+                # Rebuild the handler list in a single pass
+                # The same function may be registered multiple times, so
+                # count by ID to only remove as many as were added
+                toRemove = defaultdict(int)
+                for func in callbacks:
+                    toRemove[id(func)] += 1
+                remaining = []
+                for func in callback_list:
+                    if toRemove.get(id(func)):
+                        toRemove[id(func)] -= 1
+                    else:
+                        remaining.append(func)
+                callback_list[:] = remaining
+                numEvents += len(callbacks)
         return numEvents
 
     @hybridmethod
@@ -136,6 +173,30 @@ class BlenderWindow(StandaloneWindow):
         """
         self._removeCallbacks(group, windowInstance, windowID)
 
+    def removeCallback(self, func, group=None):
+        """Remove an individual callback.
+        If group is not set, then it will be removed from all groups.
+        """
+        windowInstance = self.windowInstance()
+        index = windowInstance.get('callback_index', {})
+
+        numEvents = 0
+        for callbackGroup, handler, registered in list(index.get(id(func), ())):
+            if group is not None and callbackGroup != group:
+                continue
+            windowInstance['callback'][callbackGroup][handler].remove(registered)
+            _unindexCallback(index, registered, callbackGroup, handler)
+            _cancelThrottle(registered)
+
+            # Blender may have already removed it when loading a file
+            handlerList = _getHandlerList(handler)
+            for i, f in enumerate(handlerList):
+                if f is registered:
+                    del handlerList[i]
+                    break
+            numEvents += 1
+        return numEvents
+
     def _addBlenderCallbackGroup(self, group):
         """Add a callback group."""
         windowInstance = self.windowInstance()
@@ -143,14 +204,29 @@ class BlenderWindow(StandaloneWindow):
             return
         windowInstance['callback'][group] = defaultdict(list)
 
-    def _addApplicationHandler(self, handler, func, persistent=True, group=None):
+    def _addApplicationHandler(self, handler, func, persistent=True, group=None, throttle=None):
         """Add an application handler.
 
+        Parameters:
+            throttle (float): Limit how often the function can run, in seconds.
+                This is intended for handlers that may trigger many times
+                a second, such as "depsgraph_update_post".
+                The function will be called without any arguments.
+
         See Also:
             https://docs.blender.org/api/2.79/bpy.app.handlers.html
         """
         self._addBlenderCallbackGroup(group)
 
+        # Skip if the function is already registered to the group
+        callbacks = self.windowInstance()['callback'][group]
+        if _containsIdentical(callbacks.get(handler, ()), func):
+            return
+
+        original = func
+        if throttle:
+            func = _throttle(func, throttle)
+
         # Persistent handlers appear to just have the _bpy_persistent attribute added
         isPersistent = hasattr(func, '_bpy_persistent')
         if persistent and not isPersistent:
@@ -159,135 +235,65 @@ class BlenderWindow(StandaloneWindow):
             del func._bpy_persistent
 
         # Add the function to the handler
-        getattr(bpy.app.handlers, handler).append(func)
-        self.windowInstance()['callback'][group][handler].append(func)
-
-    @deprecate
-    def addCallbackFrameChangeAfter(self, func, persistent=True, group=None):
-        """After frame change for playback and rendering."""
-        self._addApplicationHandler('frame_change_post', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackFrameChangeBefore(self, func, persistent=True, group=None):
-        """Before frame change for playback and rendering."""
-        self._addApplicationHandler('frame_change_pre', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackGameAfter(self, func, persistent=True, group=None):
-        """On ending the game engine."""
-        self._addApplicationHandler('game_post', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackGameBefore(self, func, persistent=True, group=None):
-        """On starting the game engine."""
-        self._addApplicationHandler('game_pre', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackLoadSceneAfter(self, func, persistent=True, group=None):
-        """After loading a new blend file."""
-        self._addApplicationHandler('load_post', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackLoadSceneBefore(self, func, persistent=True, group=None):
-        """After loading a new blend file."""
-        self._addApplicationHandler('load_pre', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackRenderCancel(self, func, persistent=True, group=None):
-        """On canceling a render job."""
-        self._addApplicationHandler('render_cancel', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackRenderComplete(self, func, persistent=True, group=None):
-        """On completion of render job."""
-        self._addApplicationHandler('render_complete', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackRenderInit(self, func, persistent=True, group=None):
-        """On initialisation of a render job."""
-        self._addApplicationHandler('render_init', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackRenderAfter(self, func, persistent=True, group=None):
-        """After rendering."""
-        self._addApplicationHandler('render_post', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackRenderBefore(self, func, persistent=True, group=None):
-        """Before rendering."""
-        self._addApplicationHandler('render_pre', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackRenderStats(self, func, persistent=True, group=None):
-        """On printing render statistics."""
-        self._addApplicationHandler('render_stats', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackRenderWrite(self, func, persistent=True, group=None):
-        """After writing a rendered frame."""
-        self._addApplicationHandler('render_write', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackSaveSceneAfter(self, func, persistent=True, group=None):
-        """After saving a blend file."""
-        self._addApplicationHandler('save_post', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackSaveSceneBefore(self, func, persistent=True, group=None):
-        """Before saving blend file."""
-        self._addApplicationHandler('save_pre', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackSceneUpdateAfter(self, func, persistent=True, group=None):
-        """After each scene data update.
-        It does not necessarily imply that anything has changed.
-        Removed in Blender 2.80
-        """
-        self._addApplicationHandler('scene_update_post', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackSceneUpdateBefore(self, func, persistent=True, group=None):
-        """After each scene data update.
-        It does not necessarily imply that anything has changed.
-        Removed in Blender 2.80
-        """
-        self._addApplicationHandler('scene_update_pre', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackVersionUpdate(self, func, persistent=True, group=None):
-        """On ending the versioning code."""
-        self._addApplicationHandler('version_update', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackDepsgraphUpdateAfter(self, func, persistent=True, group=None):
-        """After depsgraph update.
-        Added in Blender 2.80.
-        """
-        self._addApplicationHandler('depsgraph_update_post', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackDepsgraphUpdateBefore(self, func, persistent=True, group=None):
-        """Before depsgraph update.
-        Added in Blender 2.80.
-        """
-        self._addApplicationHandler('depsgraph_update_pre', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackUndoAfter(self, func, persistent=True, group=None):
-        """After loading an undo step."""
-        self._addApplicationHandler('undo_post', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackUndoBefore(self, func, persistent=True, group=None):
-        """Before loading an undo step."""
-        self._addApplicationHandler('undo_pre', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackRedoAfter(self, func, persistent=True, group=None):
-        """After loading a redo step."""
-        self._addApplicationHandler('redo_post', func, persistent=persistent, group=group)
-
-    @deprecate
-    def addCallbackRedoBefore(self, func, persistent=True, group=None):
-        """Before loading a redo step."""
-        self._addApplicationHandler('redo_pre', func, persistent=persistent, group=group)
+        _getHandlerList(handler).append(func)
+        callbacks[handler].append(func)
+
+        # Index by the original function for removeCallback
+        index = self.windowInstance().setdefault('callback_index', defaultdict(list))
+        index[id(original)].append((group, handler, func))
+
+
+# Legacy callback methods and the Blender handlers they are added to
+_LEGACY_CALLBACKS = (
+    ('addCallbackFrameChangeAfter', 'frame_change_post', 'After frame change for playback and rendering.'),
+    ('addCallbackFrameChangeBefore', 'frame_change_pre', 'Before frame change for playback and rendering.'),
+    ('addCallbackGameAfter', 'game_post', 'On ending the game engine.'),
+    ('addCallbackGameBefore', 'game_pre', 'On starting the game engine.'),
+    ('addCallbackLoadSceneAfter', 'load_post', 'After loading a new blend file.'),
+    ('addCallbackLoadSceneBefore', 'load_pre', 'After loading a new blend file.'),
+    ('addCallbackRenderCancel', 'render_cancel', 'On canceling a render job.'),
+    ('addCallbackRenderComplete', 'render_complete', 'On completion of render job.'),
+    ('addCallbackRenderInit', 'render_init', 'On initialisation of a render job.'),
+    ('addCallbackRenderAfter', 'render_post', 'After rendering.'),
+    ('addCallbackRenderBefore', 'render_pre', 'Before rendering.'),
+    ('addCallbackRenderStats', 'render_stats', 'On printing render statistics.'),
+    ('addCallbackRenderWrite', 'render_write', 'After writing a rendered frame.'),
+    ('addCallbackSaveSceneAfter', 'save_post', 'After saving a blend file.'),
+    ('addCallbackSaveSceneBefore', 'save_pre', 'Before saving blend file.'),
+    ('addCallbackSceneUpdateAfter', 'scene_update_post', 'After each scene data update. It does not necessarily imply that anything has changed. Removed in Blender 2.80.'),
+    ('addCallbackSceneUpdateBefore', 'scene_update_pre', 'After each scene data update. It does not necessarily imply that anything has changed. Removed in Blender 2.80.'),
+    ('addCallbackVersionUpdate', 'version_update', 'On ending the versioning code.'),
+    ('addCallbackDepsgraphUpdateAfter', 'depsgraph_update_post', 'After depsgraph update. Added in Blender 2.80.'),
+    ('addCallbackDepsgraphUpdateBefore', 'depsgraph_update_pre', 'Before depsgraph update. Added in Blender 2.80.'),
+    ('addCallbackUndoAfter', 'undo_post', 'After loading an undo step.'),
+    ('addCallbackUndoBefore', 'undo_pre', 'Before loading an undo step.'),
+    ('addCallbackRedoAfter', 'redo_post', 'After loading a redo step.'),
+    ('addCallbackRedoBefore', 'redo_pre', 'Before loading a redo step.'),
+)
+
+
+_LEGACY_CALLBACK_DOC = """{}
+
+Parameters:
+    func (callable): Function to add to the handler.
+    persistent (bool): If the handler should remain after loading a file.
+    group (str): Callback group, so they can be removed together.
+    throttle (float): Limit how often the function can run, in seconds.
+        The function will then be called without any arguments, as
+        Blender only guarantees them during the callback.
+        The preferred way of doing this is `self.callbacks.add`.
+"""
+
+
+def _legacyCallbackMethod(name, handler, doc):
+    """Create a deprecated method to add an application handler."""
+    def addCallback(self, func, persistent=True, group=None, throttle=None):
+        self._addApplicationHandler(handler, func, persistent=persistent, group=group, throttle=throttle)
+    addCallback.__name__ = name
+    addCallback.__doc__ = _LEGACY_CALLBACK_DOC.format(doc)
+    return deprecate(addCallback)
+
+
+for _name, _handler, _doc in _LEGACY_CALLBACKS:
+    setattr(BlenderWindow, _name, _legacyCallbackMethod(_name, _handler, _doc))
+del _name, _handler, _doc
@@ -3,19 +3,22 @@ from __future__ import absolute_import
 import os
 import sys
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
+
+
+# The executable can't change, so read the version from it once
+# TODO: Check what path was
+try:
+    _VERSION_STRING = sys.executable.rsplit(os.path.sep, 4)[-4].rsplit('.', 1)[0]
+except (AttributeError, TypeError, IndexError):
+    _VERSION_STRING = ''
 
 
 class CryEngineVersion(AbstractVersion):
     """CryEngine Sandbox version data for comparisons."""
 
     def __init__(self):
-        # TODO: Check what path was
-        try:
-            version = sys.executable.split(os.path.sep)[-4].rsplit('.', 1)[0]
-        except (TypeError, IndexError):
-            version = ''
-        super(CryEngineVersion, self).__init__(version)
+        super(CryEngineVersion, self).__init__(_VERSION_STRING)
 
 
 class CryEngineApplication(AbstractApplication):
@@ -32,4 +35,4 @@ class CryEngineApplication(AbstractApplication):
     VERSION = CryEngineVersion
 
 
-Application = CryEngineApplication()
+__getattr__ = lazyApplication(CryEngineApplication)
@@ -2,21 +2,44 @@
 
 from __future__ import absolute_import
 
-from Qt import QtWidgets
+import weakref
 
-import SandboxBridge
+from Qt import QtWidgets
 
 from .application import Application
 from ..utils import setCoordinatesToScreen, hybridmethod, getWindowSettings
 from ..standalone.gui import StandaloneWindow
 
 
+_MAIN_WINDOW = None
+
+
+def _isMainWindow(widget):
+    """Determine if a widget is the CryEngine main window."""
+    # Check the name first as it rules out almost every widget
+    return widget.objectName() == 'mainWindow' and widget.__class__ is QtWidgets.QWidget and widget.parentWidget() is None
+
+
 def getMainWindow():
     """Get a pointer to the CryEngine window.
     This doesn't appear to make any difference to a standalone window.
+
+    The result is cached, and will be searched for again if the
+    window is deleted.
     """
+    global _MAIN_WINDOW
+    if _MAIN_WINDOW is not None:
+        widget = _MAIN_WINDOW()
+        try:
+            if widget is not None and _isMainWindow(widget):
+                return widget
+        except RuntimeError:  # Qt object already deleted
+            pass
+        _MAIN_WINDOW = None
+
     for widget in QtWidgets.QApplication.topLevelWidgets():
-        if type(widget) == QtWidgets.QWidget and widget.parentWidget() is None and widget.objectName() == 'mainWindow':
+        if _isMainWindow(widget):
+            _MAIN_WINDOW = weakref.ref(widget)
             return widget
 
 
@@ -35,11 +58,7 @@ class CryWindow(StandaloneWindow):
 
     def saveWindowPosition(self):
         """Save the window location."""
-        if self.application in self.windowSettings:
-            settings = self.windowSettings[self.application]
-        else:
-            settings = self.windowSettings[self.application] = {}
-
+        settings = self.windowSettings.setdefault(self.application, {})
         settings['docked'] = self.dockable(raw=True)
 
         if self.dockable():
@@ -88,20 +107,16 @@ class CryWindow(StandaloneWindow):
             settings = getWindowSettings(cls.WindowID)
 
         #Load settings
-        if hasattr(cls, 'WindowDockable'):
-            docked = cls.WindowDockable
-        else:
-            try:
-                docked = settings[self.application]['docked']
-            except KeyError:
-                try:
-                    docked = cls.WindowDefaults['docked']
-                except (AttributeError, KeyError):
-                    docked = True
+        docked = getattr(cls, 'WindowDockable', None)
+        if docked is None:
+            docked = settings.get(self.application, {}).get('docked')
+            if docked is None:
+                docked = getattr(cls, 'WindowDefaults', {}).get('docked', True)
 
         # Apparently this should add the window to the "Tools" menu,
         # but I couldn't figure it out so it's disabled for now
         if False and docked:
+            import SandboxBridge
             return SandboxBridge.register_window(
                 window_type=cls,
                 name=getattr(cls, 'WindowName', 'New Window'),
@@ -12,6 +12,11 @@ from .abstract import callbacks
 logging.basicConfig()
 callbacks.logger.setLevel(logging.DEBUG)
 
+# Qt events are too frequent to show by default
+# Set this to DEBUG to see them
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
 
 class TestWindow(VFXWindow):
     WindowID = 'vfxwindow.debug'
@@ -19,7 +24,6 @@ class TestWindow(VFXWindow):
     WindowDockable = True
 
     def __init__(self, **kwargs):
-        self._signalPause = False
         super(TestWindow, self).__init__(**kwargs)
         self.setWindowIcon(self.style().standardIcon(QtWidgets.QStyle.SP_DirIcon))
 
@@ -74,10 +78,23 @@ class TestWindow(VFXWindow):
 
         self.windowReady.connect(self.refresh)
         refreshAll.clicked.connect(self.refresh)
-        self.xPos.valueChanged.connect(self.moveRequested)
-        self.yPos.valueChanged.connect(self.moveRequested)
-        self.wVal.valueChanged.connect(self.resizeRequested)
-        self.hVal.valueChanged.connect(self.resizeRequested)
+
+        # Group together changes made in quick succession
+        # Moving waits until the values settle, while resizing runs at
+        # a fixed rate so the window follows the values
+        self._moveTimer = QtCore.QTimer(self)
+        self._moveTimer.setSingleShot(True)
+        self._moveTimer.setInterval(50)
+        self._moveTimer.timeout.connect(self.moveRequested)
+        self._resizeTimer = QtCore.QTimer(self)
+        self._resizeTimer.setSingleShot(True)
+        self._resizeTimer.setInterval(50)
+        self._resizeTimer.timeout.connect(self.resizeRequested)
+
+        self.xPos.valueChanged.connect(self._queueMove)
+        self.yPos.valueChanged.connect(self._queueMove)
+        self.wVal.valueChanged.connect(self._queueResize)
+        self.hVal.valueChanged.connect(self._queueResize)
         self.floatingChk.stateChanged.connect(self.toggleFloating)
         self.visibleChk.stateChanged.connect(self.toggleVisible)
 
@@ -301,7 +318,10 @@ class TestWindow(VFXWindow):
 
     @QtCore.Slot()
     def refresh(self):
-        self._signalPause = True
+        # Block the signals so the values aren't sent back to the window
+        widgets = (self.xPos, self.yPos, self.wVal, self.hVal, self.floatingChk, self.visibleChk)
+        for widget in widgets:
+            widget.blockSignals(True)
         try:
             self.xPos.setValue(self.x())
             self.yPos.setValue(self.y())
@@ -310,43 +330,47 @@ class TestWindow(VFXWindow):
             self.floatingChk.setChecked(self.floating())
             self.visibleChk.setChecked(self.isVisible())
         finally:
-            self._signalPause = False
+            for widget in widgets:
+                widget.blockSignals(False)
+
+    @QtCore.Slot()
+    def _queueMove(self):
+        """Restart the move timer so only the final value is used."""
+        self._moveTimer.start()
+
+    @QtCore.Slot()
+    def _queueResize(self):
+        """Start the resize timer if it's not already running."""
+        if not self._resizeTimer.isActive():
+            self._resizeTimer.start()
 
     @QtCore.Slot()
     def moveRequested(self):
-        if self._signalPause:
-            return
         self.move(self.xPos.value(), self.yPos.value())
 
     @QtCore.Slot()
     def resizeRequested(self):
-        if self._signalPause:
-            return
         self.resize(self.wVal.value(), self.hVal.value())
 
     @QtCore.Slot(int)
     def toggleFloating(self, checkState):
-        if self._signalPause:
-            return
         self.setFloating(checkState == QtCore.Qt.Checked)
 
     @QtCore.Slot(int)
     def toggleVisible(self, checkState):
-        if self._signalPause:
-            return
         self.setVisible(checkState == QtCore.Qt.Checked)
 
     @classmethod
     def clearWindowInstance(cls, *args, **kwargs):
-        print('clearWindowInstance')
+        logger.info('clearWindowInstance')
         return super(TestWindow, cls).clearWindowInstance(*args, **kwargs)
 
     def closeEvent(self, *args, **kwargs):
-        print('closeEvent')
+        logger.info('closeEvent')
         return super(TestWindow, self).closeEvent(*args, **kwargs)
 
     def eventFilter(self, obj, event):
-        print('eventFilter on {}: {}'.format(obj, event.type()))
+        logger.debug('eventFilter on %s: %s', obj, event.type())
         return super(TestWindow, self).eventFilter(obj, event)
 
     def _nukeThisNode(self):
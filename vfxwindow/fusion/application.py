@@ -7,7 +7,7 @@ try:
 except ImportError:
     bmd = None
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
 
 
 class FusionVersion(AbstractVersion):
@@ -15,7 +15,7 @@ class FusionVersion(AbstractVersion):
 
     def __init__(self):
         path = bmd.getcurrentdir()  # C:\Program Files\Blackmagic Design\Fusion 9\
-        version = path.split(os.path.sep)[-2].split(' ', 1)[1]
+        version = path.rsplit(os.path.sep, 2)[-2].partition(' ')[2]
         super(FusionVersion, self).__init__(version, major=version, minor='0', patch='0')
 
 
@@ -34,4 +34,4 @@ class FusionApplication(AbstractApplication):
     VERSION = FusionVersion
 
 
-Application = FusionApplication()
+__getattr__ = lazyApplication(FusionApplication)
@@ -5,7 +5,7 @@ try:
 except ImportError:
     hou = None
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
 
 
 class HoudiniVersion(AbstractVersion):
@@ -32,4 +32,4 @@ class HoudiniApplication(AbstractApplication):
     VERSION = HoudiniVersion
 
 
-Application = HoudiniApplication()
+__getattr__ = lazyApplication(HoudiniApplication)
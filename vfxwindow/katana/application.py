@@ -7,7 +7,7 @@ try:
 except ImportError:
     Configuration = None
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
 
 
 class KatanaVersion(AbstractVersion):
@@ -45,4 +45,4 @@ class KatanaApplication(AbstractApplication):
         return bool(Configuration.get('KATANA_BATCH_MODE'))
 
 
-Application = KatanaApplication()
+__getattr__ = lazyApplication(KatanaApplication)
@@ -3,15 +3,28 @@ from __future__ import absolute_import
 import os
 import sys
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
+
+
+def _getExecutableVersion():
+    """Read the version from the executable path.
+    An empty string is returned if the path is not in the expected format.
+    """
+    try:
+        return sys.executable.rsplit(os.path.sep, 2)[-2].split('_')[-1]
+    except (AttributeError, IndexError):
+        return ''
+
+
+# The version is read from the executable path, so it only needs parsing once
+_EXECUTABLE_VERSION = _getExecutableVersion()
 
 
 class MaxVersion(AbstractVersion):
     """3ds Max version data for comparisons."""
 
     def __init__(self):
-        version = sys.executable.split(os.path.sep)[-2].split('_')[-1]
-        super(MaxVersion, self).__init__(version, major=version, minor='0', patch='0')
+        super(MaxVersion, self).__init__(_EXECUTABLE_VERSION, major=_EXECUTABLE_VERSION, minor='0', patch='0')
 
 
 class MaxApplication(AbstractApplication):
@@ -28,4 +41,4 @@ class MaxApplication(AbstractApplication):
     VERSION = MaxVersion
 
 
-Application = MaxApplication()
+__getattr__ = lazyApplication(MaxApplication)
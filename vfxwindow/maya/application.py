@@ -1,28 +1,49 @@
 from __future__ import absolute_import
 
+import re
+
 try:
     import maya.cmds as mc
 except ImportError:
     mc = None
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
+from ..utils import cachedproperty
+
+
+def _initialize():
+    """Ensure `maya.cmds` is populated.
+    If running a script on the farm, `maya.cmds` may not be populated.
+    Initialize if so - it won't uninitialize after or it will crash.
+    """
+    try:
+        mc.about
+    except AttributeError:
+        import maya.standalone
+        maya.standalone.initialize(name='python')
 
 
 class MayaVersion(AbstractVersion):
     """Maya version data for comparisons."""
 
     def __init__(self):
-        # If running a script on the farm, `maya.cmds` may not be populated
-        # Initialize if so - it won't uninitialize after or it will crash
-        try:
-            mc.about
-        except AttributeError:
-            import maya.standalone
-            maya.standalone.initialize(name='python')
-
-        super(MayaVersion, self).__init__(major=mc.about(majorVersion=True),  # '2020'
-                                          minor=mc.about(minorVersion=True),  # '4'
-                                          patch=mc.about(patchVersion=True))  # '0'
+        _initialize()
+
+        # Read as many parts as possible from a single query
+        # Releases without an update, such as 'Autodesk Maya 2019',
+        # only need the remaining parts queried
+        match = re.search(r'(\d{4})(?:\.(\d+))?(?:\.(\d+))?', mc.about(installedVersion=True))  # 'Autodesk Maya 2020.4'
+        if match is None:
+            major = mc.about(majorVersion=True)  # '2020'
+            minor = patch = None
+        else:
+            major, minor, patch = match.groups()
+        if minor is None:
+            minor = mc.about(minorVersion=True)  # '4'
+            patch = mc.about(patchVersion=True)  # '0'
+        patch = patch or '0'
+        super(MayaVersion, self).__init__(major + '.' + minor + '.' + patch,
+                                          major=major, minor=minor, patch=patch)
 
 
 class MayaApplication(AbstractApplication):
@@ -48,15 +69,18 @@ class MayaApplication(AbstractApplication):
 
     VERSION = MayaVersion
 
-    @property
+    @cachedproperty
     def gui(self):
         """If Maya is in GUI mode."""
-        return not mc.about(batch=True)
+        return not self.batch
 
-    @property
+    @cachedproperty
     def batch(self):
-        """If Maya is in batch mode."""
-        return mc.about(batch=True)
+        """If Maya is in batch mode.
+        This can't change during a session, so only query it once.
+        """
+        _initialize()
+        return bool(mc.about(batch=True))
 
 
-Application = MayaApplication()
+__getattr__ = lazyApplication(MayaApplication)
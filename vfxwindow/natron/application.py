@@ -5,7 +5,7 @@ try:
 except ImportError:
     natron = None
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
 
 
 class NatronVersion(AbstractVersion):
@@ -32,4 +32,4 @@ class NatronApplication(AbstractApplication):
     VERSION = NatronVersion
 
 
-Application = NatronApplication()
+__getattr__ = lazyApplication(NatronApplication)
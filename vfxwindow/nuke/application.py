@@ -5,7 +5,7 @@ try:
 except ImportError:
     nuke = None
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
 
 
 class NukeVersion(AbstractVersion):
@@ -38,4 +38,4 @@ class NukeApplication(AbstractApplication):
         return nuke.GUI
 
 
-Application = NukeApplication()
+__getattr__ = lazyApplication(NukeApplication)
@@ -5,7 +5,7 @@ try:
 except ImportError:
     rd = None
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
 
 
 class RenderDocVersion(AbstractVersion):
@@ -29,4 +29,4 @@ class RenderDocApplication(AbstractApplication):
     VERSION = RenderDocVersion
 
 
-Application = RenderDocApplication()
+__getattr__ = lazyApplication(RenderDocApplication)
@@ -5,7 +5,7 @@ try:
 except ImportError:
     sd = None
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
 
 
 class SubstanceDesignerVersion(AbstractVersion):
@@ -31,4 +31,4 @@ class SubstanceDesignerApplication(AbstractApplication):
     VERSION = SubstanceDesignerVersion
 
 
-Application = SubstanceDesignerApplication()
+__getattr__ = lazyApplication(SubstanceDesignerApplication)
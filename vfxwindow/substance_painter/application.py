@@ -5,7 +5,7 @@ try:
 except ImportError:
     substance_painter = None
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
 
 
 class SubstancePainterVersion(AbstractVersion):
@@ -31,4 +31,4 @@ class SubstancePainterApplication(AbstractApplication):
     VERSION = SubstancePainterVersion
 
 
-Application = SubstancePainterApplication()
+__getattr__ = lazyApplication(SubstancePainterApplication)
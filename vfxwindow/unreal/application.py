@@ -3,15 +3,28 @@ from __future__ import absolute_import
 import os
 import sys
 
-from ..abstract.application import AbstractApplication, AbstractVersion
+from ..abstract.application import AbstractApplication, AbstractVersion, lazyApplication
+
+
+def _getExecutableVersion():
+    """Read the version from the executable path.
+    An empty string is returned if the path is not in the expected format.
+    """
+    try:
+        return sys.executable.rsplit(os.path.sep, 5)[-5].split('_')[1]  # C:\Program Files\Epic Games\UE_5.3\...
+    except (AttributeError, IndexError):
+        return ''
+
+
+# The version is read from the executable path, so it only needs parsing once
+_EXECUTABLE_VERSION = _getExecutableVersion()
 
 
 class UnrealVersion(AbstractVersion):
     """Unreal version data for comparisons."""
 
     def __init__(self):
-        version = sys.executable.split(os.path.sep)[-5].split('_')[1]  # C:\Program Files\Epic Games\UE_5.3\...
-        super(UnrealVersion, self).__init__(version, patch='0')
+        super(UnrealVersion, self).__init__(_EXECUTABLE_VERSION, patch='0')
 
 
 class UnrealApplication(AbstractApplication):
@@ -31,4 +44,4 @@ class UnrealApplication(AbstractApplication):
     VERSION = UnrealVersion
 
 
-Application = UnrealApplication()
+__getattr__ = lazyApplication(UnrealApplication)
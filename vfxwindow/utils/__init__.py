@@ -1,14 +1,16 @@
 from __future__ import absolute_import
 
 import __main__
+import copy
 import inspect
 import json
 import os
 import site
+import stat
 import sys
 import tempfile
 import warnings
-from functools import wraps
+from functools import partial, wraps
 from types import ModuleType
 
 if os.name == 'nt':
@@ -19,9 +21,39 @@ else:
 
 from ..exceptions import VFXWinDeprecationWarning
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from functools import lru_cache
+except ImportError:  # Python 2
+    def lru_cache(maxsize=128, typed=False):
+        """Basic replacement for `functools.lru_cache`.
+        The cache is unbounded and only supports positional arguments.
+        """
+        def decorator(fn):
+            cache = {}
+
+            @wraps(fn)
+            def wrapper(*args):
+                key = args + tuple(map(type, args)) if typed else args
+                try:
+                    return cache[key]
+                except KeyError:
+                    result = cache[key] = fn(*args)
+                    return result
+            wrapper.cache_clear = cache.clear
+            wrapper.__wrapped__ = fn
+            return wrapper
+        return decorator
+
 
 SITE_PACKAGES = site.getsitepackages()
 
+_SETTINGS_CACHE = {}
+
 
 class hybridmethod(object):
     """Merge a normal method with a classmethod.
@@ -35,9 +67,10 @@ class hybridmethod(object):
     def __get__(self, obj, cls):
         context = obj if obj is not None else cls
 
-        @wraps(self.func)
-        def hybrid(*args, **kw):
-            return self.func(cls, context, *args, **kw)
+        # A partial is cheaper to create than a wrapped closure
+        hybrid = partial(self.func, cls, context)
+        hybrid.__name__ = self.func.__name__
+        hybrid.__doc__ = self.func.__doc__
 
         # Mimic method attributes (not required)
         hybrid.__func__ = hybrid.im_func = self.func
@@ -46,6 +79,23 @@ class hybridmethod(object):
         return hybrid
 
 
+class cachedproperty(object):
+    """Property that is only calculated on first access.
+    The result is stored on the instance, so any further access will
+    not go through the descriptor. This matches the behaviour of
+    `functools.cached_property` in Python 3.8+.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.func.__name__] = self.func(obj)
+        return value
+
+
 def searchGlobals(cls, globalsDict=None, visited=None):
     """Search from the top level globals for a particular object.
     Every time a module is found, search that too.
@@ -113,34 +163,111 @@ class CustomEncoder(json.JSONEncoder):
         return super(CustomEncoder, self).default(o)
 
 
+@lru_cache(maxsize=None)
 def getWindowSettingsPath(windowID):
-    """Get a path to the window settings."""
+    """Get a path to the window settings.
+    This is cached as it's requested every time the settings are used.
+    """
     return os.path.join(tempfile.gettempdir(), 'VFXWindow.{}.json'.format(windowID))
 
 
+def _dumpSettings(data):
+    """Serialise the settings to bytes.
+    `orjson` will be used if it is available.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=CustomEncoder().default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, cls=CustomEncoder).encode('utf-8')
+
+
+def _loadSettings(payload):
+    """Deserialise the settings from bytes.
+    `orjson` will be used if it is available.
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload.decode('utf-8'))
+
+
+def _settingsStamp(path):
+    """Get a value to detect if a settings file has been modified."""
+    stat = os.stat(path)
+    return (getattr(stat, 'st_mtime_ns', stat.st_mtime), stat.st_size)
+
+
 def getWindowSettings(windowID, path=None):
-    """Load the window settings, or return empty dict if they don't exist."""
+    """Load the window settings, or return empty dict if they don't exist.
+    The data is cached until the file is modified, and a copy is returned
+    so the cache can't be edited.
+    """
     if path is None:
         path = getWindowSettingsPath(windowID)
     try:
-        with open(path, 'r') as f:
-            return json.loads(f.read())
-    except (IOError, ValueError):
+        stamp = _settingsStamp(path)
+        cached = _SETTINGS_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            data = cached[1]
+        else:
+            with open(path, 'rb') as f:
+                data = _loadSettings(f.read())
+            _SETTINGS_CACHE[path] = (stamp, data)
+    except (IOError, OSError, ValueError):
         return {}
+    return copy.deepcopy(data)
 
 
 def saveWindowSettings(windowID, data, path=None):
-    """Save the window settings."""
+    """Save the window settings.
+    The data is written to a unique temporary file and then moved into
+    place, so an interrupted save or another session saving at the same
+    time can't leave a partial file.
+    """
     if path is None:
         path = getWindowSettingsPath(windowID)
+    payload = _dumpSettings(data)
+    try:
+        fd, tempPath = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    except (IOError, OSError):
+        return False
     try:
-        with open(path, 'w') as f:
-            f.write(json.dumps(data, indent=2, cls=CustomEncoder))
-    except IOError:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(tempPath, _settingsFileMode(path))
+        _replaceFile(tempPath, path)
+    except (IOError, OSError):
+        try:
+            os.remove(tempPath)
+        except OSError:
+            pass
         return False
+    _SETTINGS_CACHE.pop(path, None)
     return True
 
 
+def _settingsFileMode(path):
+    """Get the permissions for a settings file.
+    An existing file keeps its mode, otherwise it matches what `open`
+    would have created, as `mkstemp` only gives the owner access.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _replaceFile(src, dst):
+    """Move a file, overwriting the destination if it exists."""
+    try:
+        os.replace(src, dst)
+    except AttributeError:  # Python 2
+        if os.name == 'nt' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
 def deprecate(fn):
     """Mark a class method as deprecated."""
     @wraps(fn)
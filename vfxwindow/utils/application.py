@@ -2,6 +2,16 @@ from __future__ import absolute_import
 
 import re
 
+try:
+    from functools import lru_cache
+except ImportError:  # Python 2
+    from . import lru_cache
+
+
+_DOT_SPLIT = re.compile(r'(\.+)')
+
+_NUM_SPLIT = re.compile(r'(\d+)')
+
 
 def standardiseVersions(a, b):
     """Take two versions and return their standardised values.
@@ -11,12 +21,15 @@ def standardiseVersions(a, b):
     Note that varied version separators such as `1.5v2` are treated like
     `1.5.2` for the sake of simplicity.
 
+    The results are cached, so any inputs that are not hashable will
+    skip the cache.
+
     Returns:
         Tuple of 2 values of varying types.
 
     Tests:
         >>> standardiseVersions('1.2.3', '1.2.3')
-        ([1, 2, 3], [1, 2, 3])
+        ((1, 2, 3), (1, 2, 3))
         >>> standardiseVersions(1, 2)
         (1, 2)
         >>> standardiseVersions(1, 1.2)
@@ -24,7 +37,7 @@ def standardiseVersions(a, b):
         >>> standardiseVersions(1.2, 1)
         (1, 1)
         >>> standardiseVersions(1.2, '1.2.3')
-        ([1, 2], [1, 2])
+        ((1, 2), (1, 2))
         >>> standardiseVersions(1, '1.2.3')
         (1, 1)
         >>> standardiseVersions(1.2, '1')
@@ -34,32 +47,47 @@ def standardiseVersions(a, b):
         >>> standardiseVersions(1.2, 'v')
         (1, 'v')
         >>> standardiseVersions(1.2, '1.2v3')
-        ([1, 2], [1, 2])
+        ((1, 2), (1, 2))
         >>> standardiseVersions(1.2, '1v2')
-        ([1, 2], [1, 2])
+        ((1, 2), (1, 2))
         >>> standardiseVersions('1.2.3', '1.2.3v4')
-        ([1, 2, 3], [1, 2, 3])
+        ((1, 2, 3), (1, 2, 3))
         >>> standardiseVersions('1.2.3', '1.2.34')
-        ([1, 2, 3], [1, 2, 34])
+        ((1, 2, 3), (1, 2, 34))
         >>> standardiseVersions('1.2.3', 'v1.2.3')
-        ([1, 2, 3], [1, 2, 3])
+        ((1, 2, 3), (1, 2, 3))
         >>> standardiseVersions('v1.2.3', 'v1.2')
-        ([1, 2], [1, 2])
+        ((1, 2), (1, 2))
         >>> standardiseVersions('v1.2.3', 1)
         (1, 1)
         >>> standardiseVersions('1v3', 1.3)
-        ([1, 3], [1, 3])
+        ((1, 3), (1, 3))
         >>> standardiseVersions(1, '1v3')
         (1, 1)
         >>> standardiseVersions('1.2v3a', '1.2v3b')
-        ([1, 2, 3, 'a'], [1, 2, 3, 'b'])
+        ((1, 2, 3, 'a'), (1, 2, 3, 'b'))
         >>> standardiseVersions('1.2v3a', '1.2v3')
-        ([1, 2, 3], [1, 2, 3])
+        ((1, 2, 3), (1, 2, 3))
         >>> standardiseVersions('a.1', 'a.2')
-        (['a', 1], ['a', 2])
+        (('a', 1), ('a', 2))
         >>> standardiseVersions('a.b', 'a.d')
-        (['a', 'b'], ['a', 'd'])
+        (('a', 'b'), ('a', 'd'))
     """
+    try:
+        return _standardiseVersions(a, b)
+    except TypeError:  # Unhashable input
+        return _standardiseVersions.__wrapped__(a, b)
+
+
+@lru_cache(maxsize=512, typed=True)
+def _standardiseVersions(a, b):
+    """Cached implementation of `standardiseVersions`."""
+    # Identical strings only need tokenising once
+    if type(a) is type(b) and isinstance(a, str) and a == b:
+        tokens = _tokeniseVersion(a)
+        if tokens:
+            return tokens, tokens
+
     aInt = isinstance(a, int)
     aFloat = isinstance(a, float)
     bInt = isinstance(b, int)
@@ -73,10 +101,8 @@ def standardiseVersions(a, b):
 
     # Split any text into tokens
     # This will result in [prefix, num, separator, ..., suffix], so length 5 for a float
-    aTokens = [] if (aInt or aFloat) else tokeniseVersion(str(a))
-    aTokenInts = [token for token in aTokens if isinstance(token, int)]
-    bTokens = [] if (bInt or bFloat) else tokeniseVersion(str(b))
-    bTokenInts = [token for token in bTokens if isinstance(token, int)]
+    aTokens, aTokenInts = ((), ()) if (aInt or aFloat) else _tokeniseVersionInts(a if isinstance(a, str) else str(a))
+    bTokens, bTokenInts = ((), ()) if (bInt or bFloat) else _tokeniseVersionInts(b if isinstance(b, str) else str(b))
 
     # If inputs are both strings, then return tokens of the same length
     if aTokens and bTokens:
@@ -88,7 +114,7 @@ def standardiseVersions(a, b):
         if not bTokenInts:
             return int(a), bTokens[0]
         if len(bTokenInts) >= 2:
-            return list(map(int, str(a).split('.'))), bTokenInts[:2]
+            return tuple(map(int, str(a).split('.'))), bTokenInts[:2]
         return int(a), bTokenInts[0]
     if aInt:
         if bTokenInts:
@@ -99,7 +125,7 @@ def standardiseVersions(a, b):
         if not aTokenInts:
             return aTokens[0], int(b)
         if len(aTokenInts) >= 2:
-            return aTokenInts[:2], list(map(int, str(b).split('.')))
+            return aTokenInts[:2], tuple(map(int, str(b).split('.')))
         return aTokenInts[0], int(b)
     if bInt:
         if aTokenInts:
@@ -111,79 +137,118 @@ def standardiseVersions(a, b):
     return a, b
 
 
+@lru_cache(maxsize=512, typed=True)
+def _tokeniseVersionInts(version):
+    """Get the tokens of a version along with just the integer tokens.
+    The filtering is cached so it only happens once per version.
+    """
+    tokens = _tokeniseVersion(version)
+    return tokens, tuple(token for token in tokens if isinstance(token, int))
+
+
 def tokeniseVersion(version, ignoreV=True):
     """Take a version string and split it into tokens.
 
     Parameters:
         version (str): Application version number.
         ignoreV (bool): Ignore `v` if it is the first letter.
-            This means `v1.2` will be tokenised as `[1, 2]` rather than
-            `['v', 1, 2]`.
+            This means `v1.2` will be tokenised as `(1, 2)` rather than
+            `('v', 1, 2)`.
 
     Returns:
-        Flat list of integers and strings.
+        Flat tuple of integers and strings.
 
     Tests:
         >>> tokeniseVersion('1')
-        [1]
+        (1,)
         >>> tokeniseVersion('1.2')
-        [1, 2]
+        (1, 2)
         >>> tokeniseVersion('1v2')
-        [1, 2]
+        (1, 2)
         >>> tokeniseVersion('1.2.3')
-        [1, 2, 3]
+        (1, 2, 3)
         >>> tokeniseVersion('1.2.3v4')
-        [1, 2, 3, 4]
+        (1, 2, 3, 4)
         >>> tokeniseVersion('1.2.03v04')
-        [1, 2, 3, 4]
+        (1, 2, 3, 4)
         >>> tokeniseVersion('1.2.30v40')
-        [1, 2, 30, 40]
+        (1, 2, 30, 40)
         >>> tokeniseVersion('1.2.3v4a')
-        [1, 2, 3, 4, 'a']
+        (1, 2, 3, 4, 'a')
         >>> tokeniseVersion('a')
-        ['a']
+        ('a',)
         >>> tokeniseVersion('a1')
-        ['a', 1]
+        ('a', 1)
         >>> tokeniseVersion('a1a')
-        ['a', 1, 'a']
+        ('a', 1, 'a')
         >>> tokeniseVersion('a.b')
-        ['a', 'b']
+        ('a', 'b')
         >>> tokeniseVersion('v1')
-        [1]
+        (1,)
         >>> tokeniseVersion('12.ab.c34d.5ef6')
-        [12, 'ab', 'c34d', 5, 6]
+        (12, 'ab', 'c34d', 5, 6)
+        >>> tokeniseVersion(1.0)
+        (1, 0)
+        >>> tokeniseVersion(1)
+        (1,)
+        >>> tokeniseVersion(True)
+        ('True',)
         """
+    if not isinstance(version, str):
+        version = str(version)
+    return _tokeniseVersion(version, ignoreV)
+
+
+@lru_cache(maxsize=512, typed=True)
+def _tokeniseVersion(version, ignoreV=True):
+    """Cached implementation of `tokeniseVersion`."""
+    if not isinstance(version, str):
+        version = str(version)
+    tokens = _DOT_SPLIT.split(version)[::2]
     result = []
-    for i, token in enumerate(re.split(r'(\.+)', str(version))[::2]):
-        if token.isdigit():
-            result.append(int(token))
-            continue
 
-        subtokens = re.split(r'(\d+)', token)
+    # The first token may start with a prefix
+    token = tokens[0]
+    if token.isdigit():
+        result.append(int(token))
+    else:
+        subtokens = _NUM_SPLIT.split(token)
 
-        # If any token but the first starts with letter then treat as a word
-        if i and subtokens[0]:
+        # Single letter
+        if len(subtokens) == 1:
             result.append(token)
+
+        else:
+            # If the token starts with a letter that isn't "v"
+            if subtokens[0] and (not ignoreV or subtokens[0].lower() != 'v'):
+                result.append(subtokens[0])
+
+            # Get all integers
+            result.extend(int(t) for t in subtokens[1::2])
+
+            # Add on final letter if applicable
+            if subtokens[-1]:
+                result.append(subtokens[-1])
+
+    for token in tokens[1:]:
+        if token.isdigit():
+            result.append(int(token))
             continue
 
-        numTokens = len(subtokens)
+        subtokens = _NUM_SPLIT.split(token)
 
-        # Single letter
-        if numTokens == 1:
+        # If the token starts with a letter then treat as a word
+        if subtokens[0] or len(subtokens) == 1:
             result.append(token)
             continue
 
-        # If the first token starts with a letter that isn't "v"
-        if not i and subtokens[0] and (not ignoreV or subtokens[0].lower() != 'v'):
-            result.append(subtokens[0])
-
         # Get all integers
         result.extend(int(t) for t in subtokens[1::2])
 
         # Add on final letter if applicable
         if subtokens[-1]:
             result.append(subtokens[-1])
-    return result
+    return tuple(result)
 
 
 if __name__ == '__main__':